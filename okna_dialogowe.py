@@ -0,0 +1,246 @@
+import math
+import tkinter as tk
+from tkinter import ttk
+
+from rdzen.kolory import cmyk_na_rgb, hex_na_rgb, rgb_na_cmyk, rgb_na_hex, srednia_kolorow
+
+
+# --- KLASA KONWERTERA KOLORÓW ---
+
+class ColorConverterDialog(tk.Toplevel):
+    def __init__(self, parent, initial_rgb=None, callback=None):
+        super().__init__(parent)
+        self.title("Konwerter Kolorów RGB <-> CMYK")
+        self.resizable(False, False)
+        self.callback = callback
+        self.is_modal = callback is not None
+
+        self.r_var = tk.IntVar(value=0)
+        self.g_var = tk.IntVar(value=0)
+        self.b_var = tk.IntVar(value=0)
+        self.c_var = tk.DoubleVar(value=0.0)
+        self.m_var = tk.DoubleVar(value=0.0)
+        self.y_var = tk.DoubleVar(value=0.0)
+        self.k_var = tk.DoubleVar(value=100.0)
+
+        if initial_rgb:
+            r, g, b = initial_rgb
+            self.r_var.set(r)
+            self.g_var.set(g)
+            self.b_var.set(b)
+
+        main_frame = ttk.Frame(self, padding=10)
+        main_frame.pack(expand=True, fill=tk.BOTH)
+
+        rgb_frame = ttk.LabelFrame(main_frame, text="Model RGB (0-255)")
+        rgb_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5, pady=5)
+        self._create_slider_entry_block(rgb_frame, "R:", self.r_var, 0, 255, self.update_from_rgb)
+        self._create_slider_entry_block(rgb_frame, "G:", self.g_var, 0, 255, self.update_from_rgb)
+        self._create_slider_entry_block(rgb_frame, "B:", self.b_var, 0, 255, self.update_from_rgb)
+
+        cmyk_frame = ttk.LabelFrame(main_frame, text="Model CMYK (0-100)")
+        cmyk_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5, pady=5)
+        self._create_slider_entry_block(cmyk_frame, "C:", self.c_var, 0, 100, self.update_from_cmyk)
+        self._create_slider_entry_block(cmyk_frame, "M:", self.m_var, 0, 100, self.update_from_cmyk)
+        self._create_slider_entry_block(cmyk_frame, "Y:", self.y_var, 0, 100, self.update_from_cmyk)
+        self._create_slider_entry_block(cmyk_frame, "K:", self.k_var, 0, 100, self.update_from_cmyk)
+
+        preview_frame = ttk.LabelFrame(main_frame, text="Podgląd")
+        preview_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        self.color_preview = tk.Frame(preview_frame, bg="#000000", width=100, height=100, relief=tk.SUNKEN,
+                                      borderwidth=2)
+        self.color_preview.pack(expand=True)
+        self.hex_label = ttk.Label(preview_frame, text="#000000", font=("Monospace", 10))
+        self.hex_label.pack(pady=5)
+
+        if self.is_modal:
+            button_frame = ttk.Frame(main_frame)
+            button_frame.pack(pady=10, fill=tk.X)
+            ttk.Button(button_frame, text="OK", command=self._on_ok).pack(side=tk.LEFT, padx=5)
+            ttk.Button(button_frame, text="Anuluj", command=self.destroy).pack(side=tk.LEFT, padx=5)
+
+        self.r_var.trace_add("write", self.update_from_rgb)
+        self.g_var.trace_add("write", self.update_from_rgb)
+        self.b_var.trace_add("write", self.update_from_rgb)
+        self.c_var.trace_add("write", self.update_from_cmyk)
+        self.m_var.trace_add("write", self.update_from_cmyk)
+        self.y_var.trace_add("write", self.update_from_cmyk)
+        self.k_var.trace_add("write", self.update_from_cmyk)
+
+        self.update_from_rgb()
+
+        if self.is_modal:
+            self.grab_set()
+            self.transient(parent)
+
+    def _create_slider_entry_block(self, parent, label, variable, from_, to, command):
+        frame = ttk.Frame(parent)
+        frame.pack(fill=tk.X, padx=5, pady=2)
+        ttk.Label(frame, text=label, width=3).pack(side=tk.LEFT)
+        slider = ttk.Scale(frame, from_=from_, to=to, variable=variable, orient=tk.HORIZONTAL, command=command)
+        slider.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=5)
+        entry = ttk.Entry(frame, textvariable=variable, width=5)
+        entry.pack(side=tk.LEFT)
+
+    def _aktualizuj_podglad(self, r, g, b):
+        hex_color = rgb_na_hex(r, g, b)
+        self.color_preview.config(bg=hex_color)
+        self.hex_label.config(text=hex_color.upper())
+
+    def update_from_rgb(self, *args):
+        r, g, b = self.r_var.get(), self.g_var.get(), self.b_var.get()
+        c_100, m_100, y_100, k_100 = rgb_na_cmyk(r, g, b)
+        self.c_var.set(round(c_100, 2))
+        self.m_var.set(round(m_100, 2))
+        self.y_var.set(round(y_100, 2))
+        self.k_var.set(round(k_100, 2))
+        self._aktualizuj_podglad(r, g, b)
+
+    def update_from_cmyk(self, *args):
+        r_int, g_int, b_int = cmyk_na_rgb(self.c_var.get(), self.m_var.get(), self.y_var.get(), self.k_var.get())
+        self.r_var.set(r_int)
+        self.g_var.set(g_int)
+        self.b_var.set(b_int)
+        self._aktualizuj_podglad(r_int, g_int, b_int)
+
+    def _on_ok(self):
+        r, g, b = self.r_var.get(), self.g_var.get(), self.b_var.get()
+        if self.callback:
+            self.callback((r, g, b))
+        self.destroy()
+
+
+# --- KLASA WIDOKU KOSTKI 3D ---
+
+class CubeViewerDialog(tk.Toplevel):
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.title("Wizualizator Kostki RGB (3D)")
+        self.geometry("400x400")
+
+        self.angle_x = self.angle_y = self.angle_z = 0
+        self.last_mouse_x = self.last_mouse_y = 0
+        self.selected_vertex = None
+
+        self.vertices = [
+            (-1, -1, -1, "Black (0,0,0)", "#000000"),
+            (1, -1, -1, "Red (R)", "#FF0000"),
+            (-1, 1, -1, "Green (G)", "#00FF00"),
+            (1, 1, -1, "Yellow (R+G)", "#FFFF00"),
+            (-1, -1, 1, "Blue (B)", "#0000FF"),
+            (1, -1, 1, "Magenta (R+B)", "#FF00FF"),
+            (-1, 1, 1, "Cyan (G+B)", "#00FFFF"),
+            (1, 1, 1, "White (R+G+B)", "#FFFFFF")
+        ]
+        self.edges = [
+            (0, 1), (0, 2), (0, 4), (1, 3), (1, 5), (2, 3), (2, 6),
+            (3, 7), (4, 5), (4, 6), (5, 7), (6, 7)
+        ]
+        self.faces = [
+            [0, 1, 3, 2], [4, 5, 7, 6], [0, 2, 6, 4],
+            [1, 3, 7, 5], [0, 1, 5, 4], [2, 3, 7, 6]
+        ]
+
+        self.canvas = tk.Canvas(self, bg="lightgrey")
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        self.canvas.bind("<ButtonPress-1>", self._on_press)
+        self.canvas.bind("<B1-Motion>", self._on_drag)
+        self.canvas.bind("<Double-Button-1>", self._on_double_click)
+        self._draw_cube()
+
+    def _on_press(self, event):
+        self.last_mouse_x = event.x
+        self.last_mouse_y = event.y
+
+    def _on_drag(self, event):
+        dx = event.x - self.last_mouse_x
+        dy = event.y - self.last_mouse_y
+        self.angle_y += dx * 0.01
+        self.angle_x += dy * 0.01
+        self.last_mouse_x = event.x
+        self.last_mouse_y = event.y
+        self._draw_cube()
+
+    def _on_double_click(self, event):
+        x, y = event.x, event.y
+        projected_points, _ = self._project_vertices()
+        closest = None
+        min_dist = float('inf')
+        for i, (px, py, _, _) in enumerate(projected_points):
+            dist = math.sqrt((x - px) ** 2 + (y - py) ** 2)
+            if dist < min_dist and dist < 10:
+                min_dist = dist
+                closest = i
+        if closest is not None:
+            self.selected_vertex = closest
+            initial_hex = self.vertices[closest][4]
+            r, g, b = hex_na_rgb(initial_hex)
+
+            def callback(rgb):
+                new_r, new_g, new_b = rgb
+                new_hex = rgb_na_hex(new_r, new_g, new_b)
+                self.vertices[closest] = list(self.vertices[closest])
+                self.vertices[closest][4] = new_hex
+                self.vertices[closest] = tuple(self.vertices[closest])
+                self._draw_cube()
+
+            dialog = ColorConverterDialog(self, initial_rgb=(r, g, b), callback=callback)
+            dialog.wait_window()
+
+    def _rotate_point(self, x, y, z):
+        cos_x, sin_x = math.cos(self.angle_x), math.sin(self.angle_x)
+        y_rot, z_rot = y * cos_x - z * sin_x, y * sin_x + z * cos_x
+        y, z = y_rot, z_rot
+        cos_y, sin_y = math.cos(self.angle_y), math.sin(self.angle_y)
+        x_rot, z_rot = x * cos_y + z * sin_y, -x * sin_y + z * cos_y
+        return x_rot, y, z_rot
+
+    def _project_vertices(self):
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        center_x, center_y = width / 2, height / 2
+        scale = min(width, height) * 0.4
+        projected_points, rotated_points = [], []
+
+        for x, y, z, label, color in self.vertices:
+            x_rot, y_rot, z_rot = self._rotate_point(x, y, z)
+            rotated_points.append((x_rot, y_rot, z_rot))
+            x_proj = center_x + x_rot * scale
+            y_proj = center_y - y_rot * scale
+            projected_points.append((x_proj, y_proj, label, color))
+
+        return projected_points, rotated_points
+
+    def _draw_cube(self):
+        self.canvas.delete("all")
+        projected_points, rotated_points = self._project_vertices()
+        faces_with_z = []
+        for face in self.faces:
+            avg_z = sum(rotated_points[i][2] for i in face) / len(face)
+            face_color = self._average_colors([self.vertices[i][4] for i in face])
+            faces_with_z.append((avg_z, face, face_color))
+
+        faces_with_z.sort(reverse=True, key=lambda x: x[0])
+
+        for _, face, face_color in faces_with_z:
+            points = []
+            for i in face:
+                points.extend(projected_points[i][:2])
+            self.canvas.create_polygon(points, fill=face_color, outline='', width=0)
+
+        for i_start, i_end in self.edges:
+            x1, y1, _, color1 = projected_points[i_start]
+            x2, y2, _, color2 = projected_points[i_end]
+            edge_color = self._average_hex(color1, color2)
+            self.canvas.create_line(x1, y1, x2, y2, fill=edge_color, width=2)
+
+        for x_proj, y_proj, label, color in projected_points:
+            self.canvas.create_oval(x_proj - 5, y_proj - 5, x_proj + 5, y_proj + 5, fill=color, outline="black")
+            self.canvas.create_text(x_proj, y_proj - 10, text=label, anchor=tk.S, font=("Arial", 8))
+
+    def _average_hex(self, hex1, hex2):
+        return self._average_colors([hex1, hex2])
+
+    def _average_colors(self, hex_list):
+        return srednia_kolorow(hex_list)
@@ -0,0 +1,261 @@
+import json
+import os
+import queue
+import shutil
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+from .ksztalty import ksztalt_z_dict
+
+
+# Dziennik operacji dopisywanych przez wątek roboczy; kompaktowany do migawki, gdy urośnie do rozmiaru
+# ostatniej migawki. Każdy zapis migawki jest więc opłacony co najmniej taką samą ilością zapisanych zmian,
+# a koszt autozapisu zależy od tempa edycji, nie od wielkości rysunku.
+# Każda operacja ma numer, a migawka zapamiętuje numer ostatniej uwzględnionej operacji,
+# więc awaria pomiędzy zapisem migawki a wyczyszczeniem dziennika nie powoduje podwójnego odtworzenia.
+# Każdy proces pisze do własnego katalogu sesji i przez cały czas działania trzyma blokadę pliku
+# <sesja>.blokada obok niego. Blokadę systemową zwalnia też awaria procesu, więc do odtworzenia nadają się
+# tylko sesje, których blokadę da się przejąć. Plik blokady powstaje i jest blokowany przed katalogiem
+# sesji, więc przejęta blokada bez katalogu to pozostałość po procesie przerwanym w trakcie startu i jest usuwana.
+# Sesje, których nie da się odtworzyć, są odkładane z rozszerzeniem .uszkodzona i nie są proponowane ponownie.
+
+ROZSZERZENIE_BLOKADY = ".blokada"
+ROZSZERZENIE_USZKODZONEJ = ".uszkodzona"
+PLIK_DZIENNIKA = "dziennik.jsonl"
+PLIK_MIGAWKI = "migawka.json"
+
+
+def _zablokuj(sciezka):
+    try:
+        plik = open(sciezka, 'a+')
+    except OSError:
+        return None
+    try:
+        if fcntl:
+            fcntl.flock(plik.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(plik.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        plik.close()
+        return None
+    return plik
+
+def _odczytaj_sesje(katalog):
+    stan, numer = {}, 0
+    sciezka_migawki = os.path.join(katalog, PLIK_MIGAWKI)
+    sciezka_dziennika = os.path.join(katalog, PLIK_DZIENNIKA)
+    if os.path.exists(sciezka_migawki):
+        with open(sciezka_migawki, 'r') as f:
+            migawka = json.load(f)
+        numer = migawka['nr']
+        _zastosuj_operacje(stan, {'op': 'migawka', 'ksztalty': migawka['ksztalty']})
+    if os.path.exists(sciezka_dziennika):
+        with open(sciezka_dziennika, 'r') as f:
+            for linia in f:
+                try:
+                    operacja = json.loads(linia)
+                except json.JSONDecodeError:
+                    break
+                if operacja['nr'] > numer:
+                    numer = operacja['nr']
+                    _zastosuj_operacje(stan, operacja)
+    return list(stan.values())
+
+
+def _zastosuj_operacje(stan, operacja):
+    rodzaj = operacja['op']
+    if rodzaj in ('dodaj', 'zmien'):
+        stan[operacja['id']] = operacja['ksztalt']
+    elif rodzaj == 'usun':
+        for uid in operacja['ids']:
+            stan.pop(uid, None)
+    elif rodzaj == 'przesun':
+        for uid in operacja['ids']:
+            ksztalt = ksztalt_z_dict(stan[uid]) if uid in stan else None
+            if ksztalt:
+                ksztalt.przesun(operacja['dx'], operacja['dy'])
+                stan[uid] = ksztalt.to_dict()
+    elif rodzaj == 'migawka':
+        stan.clear()
+        stan.update((uid, dane) for uid, dane in operacja['ksztalty'])
+
+
+class AutoZapis:
+    PROPORCJA_DZIENNIKA = 1.0
+    MIN_ROZMIAR_DZIENNIKA = 64 * 1024
+
+    def __init__(self, katalog):
+        self.katalog = katalog
+        self.katalog_sesji = None
+        self.sciezka_dziennika = None
+        self.sciezka_migawki = None
+        self.blokada = None
+        self.odzyskane_sesje = []
+        self.kolejka = queue.Queue()
+        self.watek = None
+        self.stan = {}
+        self.numer = 0
+        self.rozmiar_dziennika = 0
+        self.rozmiar_migawki = 0
+        self.plik_dziennika = None
+
+    def odczytaj(self):
+        # Odtwarza stan sesji pozostawionych przez przerwane procesy. Ich blokady są trzymane do czasu
+        # usun_odzyskane(), żeby inny uruchamiany równolegle proces nie odtworzył ich drugi raz.
+        ksztalty = []
+        if not os.path.isdir(self.katalog):
+            return ksztalty
+        sesje = []
+        for nazwa in os.listdir(self.katalog):
+            if not nazwa.endswith(ROZSZERZENIE_BLOKADY):
+                continue
+            katalog_sesji = os.path.join(self.katalog, nazwa[:-len(ROZSZERZENIE_BLOKADY)])
+            blokada = _zablokuj(katalog_sesji + ROZSZERZENIE_BLOKADY)
+            if not blokada:
+                continue
+            try:
+                sesje.append((os.path.getmtime(katalog_sesji), katalog_sesji, blokada))
+            except OSError:
+                # Proces przerwany przed utworzeniem katalogu albo sesja właśnie zamknięta przez właściciela.
+                self._usun_sesje(katalog_sesji, blokada)
+        for _, katalog_sesji, blokada in sorted(sesje, key=lambda sesja: sesja[0]):
+            try:
+                ksztalty.extend(_odczytaj_sesje(katalog_sesji))
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"Nie udało się odczytać autozapisu {katalog_sesji}: {e}")
+                self._odloz_uszkodzona(katalog_sesji, blokada)
+                continue
+            self.odzyskane_sesje.append((katalog_sesji, blokada))
+        return ksztalty
+
+    def uruchom(self):
+        os.makedirs(self.katalog, exist_ok=True)
+        # Inny proces może uznać świeży, jeszcze niezablokowany plik za pozostałość i go usunąć - wtedy próbujemy ponownie.
+        while True:
+            deskryptor, sciezka_blokady = tempfile.mkstemp(prefix="sesja_", suffix=ROZSZERZENIE_BLOKADY,
+                                                           dir=self.katalog)
+            os.close(deskryptor)
+            self.blokada = _zablokuj(sciezka_blokady)
+            if self.blokada and os.path.exists(sciezka_blokady):
+                break
+            if self.blokada:
+                self.blokada.close()
+        self.katalog_sesji = sciezka_blokady[:-len(ROZSZERZENIE_BLOKADY)]
+        os.mkdir(self.katalog_sesji)
+        self.sciezka_dziennika = os.path.join(self.katalog_sesji, PLIK_DZIENNIKA)
+        self.sciezka_migawki = os.path.join(self.katalog_sesji, PLIK_MIGAWKI)
+        self.watek = threading.Thread(target=self._petla, name="autozapis", daemon=True)
+        self.watek.start()
+
+    def usun_odzyskane(self):
+        # Wykonywane przez wątek roboczy po wcześniej zleconych operacjach, czyli dopiero gdy
+        # odtworzony rysunek jest już zapisany w migawce tej sesji.
+        self.zapisz({'op': 'usun_odzyskane'})
+
+    def zapisz(self, operacja):
+        self.kolejka.put(operacja)
+
+    def migawka(self, ksztalty):
+        self.zapisz({'op': 'migawka', 'ksztalty': [(k.uid, k.to_dict()) for k in ksztalty]})
+
+    def zamknij(self):
+        # Przy poprawnym zamknięciu aplikacji pliki tej sesji nie są już potrzebne.
+        if not self.watek: return
+        self.kolejka.put(None)
+        self.watek.join()
+        self._usun_sesje(self.katalog_sesji, self.blokada)
+        self.blokada = None
+
+    def _usun_sesje(self, katalog_sesji, blokada):
+        # Katalog i plik blokady usuwane są jeszcze pod blokadą; Windows pozwala usunąć plik dopiero po zamknięciu.
+        shutil.rmtree(katalog_sesji, ignore_errors=True)
+        sciezka_blokady = katalog_sesji + ROZSZERZENIE_BLOKADY
+        try:
+            os.remove(sciezka_blokady)
+            usunieta = True
+        except OSError:
+            usunieta = False
+        if blokada:
+            blokada.close()
+        if not usunieta:
+            try:
+                os.remove(sciezka_blokady)
+            except OSError:
+                pass
+
+    def _odloz_uszkodzona(self, katalog_sesji, blokada):
+        # Zostaje na dysku do ręcznego sprawdzenia; bez pliku blokady nie będzie już odtwarzana.
+        try:
+            os.rename(katalog_sesji, katalog_sesji + ROZSZERZENIE_USZKODZONEJ)
+        except OSError:
+            pass
+        self._usun_sesje(katalog_sesji, blokada)
+
+    def _petla(self):
+        koniec = False
+        while not koniec:
+            operacje = [self.kolejka.get()]
+            while True:
+                try:
+                    operacje.append(self.kolejka.get_nowait())
+                except queue.Empty:
+                    break
+            linie, kompaktuj, usun_odzyskane = [], False, False
+            for operacja in operacje:
+                if operacja is None:
+                    koniec = True
+                    break
+                if operacja['op'] == 'usun_odzyskane':
+                    usun_odzyskane = True
+                    continue
+                self.numer += 1
+                operacja['nr'] = self.numer
+                _zastosuj_operacje(self.stan, operacja)
+                if operacja['op'] == 'migawka':
+                    linie, kompaktuj = [], True
+                else:
+                    linie.append(json.dumps(operacja))
+            try:
+                if kompaktuj:
+                    self._zapisz_migawke()
+                if linie:
+                    self._dopisz(linie)
+                if self.rozmiar_dziennika > max(self.MIN_ROZMIAR_DZIENNIKA,
+                                                self.rozmiar_migawki * self.PROPORCJA_DZIENNIKA):
+                    self._zapisz_migawke()
+            except OSError as e:
+                print(f"Błąd autozapisu: {e}")
+                usun_odzyskane = False
+            if usun_odzyskane:
+                for katalog_sesji, blokada in self.odzyskane_sesje:
+                    self._usun_sesje(katalog_sesji, blokada)
+                self.odzyskane_sesje = []
+        if self.plik_dziennika:
+            self.plik_dziennika.close()
+
+    def _dopisz(self, linie):
+        if not self.plik_dziennika:
+            self.plik_dziennika = open(self.sciezka_dziennika, 'a')
+        self.plik_dziennika.write('\n'.join(linie) + '\n')
+        self.plik_dziennika.flush()
+        os.fsync(self.plik_dziennika.fileno())
+        self.rozmiar_dziennika = os.fstat(self.plik_dziennika.fileno()).st_size
+
+    def _zapisz_migawke(self):
+        sciezka_tymczasowa = self.sciezka_migawki + '.tmp'
+        with open(sciezka_tymczasowa, 'w') as f:
+            json.dump({'nr': self.numer, 'ksztalty': list(self.stan.items())}, f)
+            f.flush()
+            os.fsync(f.fileno())
+            self.rozmiar_migawki = os.fstat(f.fileno()).st_size
+        os.replace(sciezka_tymczasowa, self.sciezka_migawki)
+        if self.plik_dziennika:
+            self.plik_dziennika.close()
+        self.plik_dziennika = open(self.sciezka_dziennika, 'w')
+        self.rozmiar_dziennika = 0
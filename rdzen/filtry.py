@@ -0,0 +1,220 @@
+import math
+import os
+
+import numpy as np
+from PIL import Image
+
+
+# Obraz przetwarzany jest jako tablica numpy (wysokosc, szerokosc, 3) typu uint8.
+
+class Filtr:
+    promien = 0
+
+    def zastosuj(self, tablica): raise NotImplementedError
+
+
+class FiltrPunktowy(Filtr):
+    def __init__(self, lut):
+        self.lut = np.clip(np.rint(lut), 0, 255).astype(np.uint8)
+
+    def zastosuj(self, tablica):
+        return self.lut[tablica]
+
+    def polacz(self, nastepny):
+        # Dwie kolejne tablice LUT składają się w jedną - jeden odczyt z tablicy zamiast dwóch.
+        return FiltrPunktowy(nastepny.lut[self.lut])
+
+
+class FiltrSkaliSzarosci(Filtr):
+    WAGI = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+    def zastosuj(self, tablica):
+        szary = np.rint(tablica.astype(np.float32) @ self.WAGI).astype(np.uint8)
+        return np.repeat(szary[..., np.newaxis], 3, axis=2)
+
+
+class FiltrSplotowy(Filtr):
+    def __init__(self, jadro):
+        self.jadro = np.asarray(jadro, dtype=np.float32)
+        self.promien = self.jadro.shape[0] // 2
+
+    def zastosuj(self, tablica):
+        h, w = tablica.shape[:2]
+        r = self.promien
+        rozszerzona = np.pad(tablica.astype(np.float32), ((r, r), (r, r), (0, 0)), mode='edge')
+        wynik = np.zeros(tablica.shape, dtype=np.float32)
+        for (dy, dx), waga in np.ndenumerate(self.jadro):
+            if waga:
+                wynik += waga * rozszerzona[dy:dy + h, dx:dx + w]
+        return np.clip(np.rint(wynik), 0, 255).astype(np.uint8)
+
+
+class FiltrSobela(Filtr):
+    promien = 1
+
+    def zastosuj(self, tablica):
+        h, w = tablica.shape[:2]
+        szary = tablica.astype(np.float32) @ FiltrSkaliSzarosci.WAGI
+        p = np.pad(szary, 1, mode='edge')
+        gx = (p[0:h, 2:w + 2] + 2 * p[1:h + 1, 2:w + 2] + p[2:h + 2, 2:w + 2]
+              - p[0:h, 0:w] - 2 * p[1:h + 1, 0:w] - p[2:h + 2, 0:w])
+        gy = (p[2:h + 2, 0:w] + 2 * p[2:h + 2, 1:w + 1] + p[2:h + 2, 2:w + 2]
+              - p[0:h, 0:w] - 2 * p[0:h, 1:w + 1] - p[0:h, 2:w + 2])
+        modul = np.clip(np.rint(np.hypot(gx, gy)), 0, 255).astype(np.uint8)
+        return np.repeat(modul[..., np.newaxis], 3, axis=2)
+
+
+class FiltrMedianowy(Filtr):
+    # Okna kopiowane są do pamięci w całości (rozmiar² bajtów na piksel i kanał), stąd górne ograniczenie.
+    MAKS_ROZMIAR = 15
+
+    def __init__(self, rozmiar=3):
+        if not 1 <= rozmiar <= self.MAKS_ROZMIAR or rozmiar != int(rozmiar) or int(rozmiar) % 2 == 0:
+            raise ValueError(f"Rozmiar filtra medianowego musi być nieparzystą liczbą od 1 do {self.MAKS_ROZMIAR}: {rozmiar}")
+        self.rozmiar = int(rozmiar)
+        self.promien = self.rozmiar // 2
+
+    def zastosuj(self, tablica):
+        r = self.promien
+        rozszerzona = np.pad(tablica, ((r, r), (r, r), (0, 0)), mode='edge')
+        okna = np.lib.stride_tricks.sliding_window_view(rozszerzona, (self.rozmiar, self.rozmiar), axis=(0, 1))
+        return np.median(okna, axis=(-2, -1)).astype(np.uint8)
+
+
+class FiltrHistogramowy(Filtr):
+    # Wymaga statystyk całego obrazu wejściowego, więc przerywa fuzję potoku.
+    def przygotuj(self, tablica): raise NotImplementedError
+
+
+class RozciagniecieHistogramu(FiltrHistogramowy):
+    def przygotuj(self, tablica):
+        minimum, maksimum = int(tablica.min()), int(tablica.max())
+        if maksimum == minimum:
+            return FiltrPunktowy(np.arange(256))
+        return FiltrPunktowy((np.arange(256) - minimum) * 255.0 / (maksimum - minimum))
+
+
+class WyrownanieHistogramu(FiltrHistogramowy):
+    def przygotuj(self, tablica):
+        dystrybuanta = np.cumsum(np.bincount(tablica.ravel(), minlength=256))
+        minimum = dystrybuanta[np.nonzero(dystrybuanta)[0][0]]
+        if dystrybuanta[-1] == minimum:
+            return FiltrPunktowy(np.arange(256))
+        return FiltrPunktowy((dystrybuanta - minimum) * 255.0 / (dystrybuanta[-1] - minimum))
+
+
+def filtr_jasnosci(zmiana):
+    return FiltrPunktowy(np.arange(256) + float(zmiana))
+
+
+def filtr_kontrastu(wspolczynnik):
+    return FiltrPunktowy((np.arange(256) - 128.0) * float(wspolczynnik) + 128.0)
+
+
+def filtr_negatywu():
+    return FiltrPunktowy(255 - np.arange(256))
+
+
+def filtr_gamma(gamma):
+    if float(gamma) <= 0:
+        raise ValueError(f"Współczynnik gamma musi być dodatni: {gamma}")
+    return FiltrPunktowy(255.0 * (np.arange(256) / 255.0) ** (1.0 / float(gamma)))
+
+
+def filtr_progowania(prog):
+    return FiltrPunktowy(np.where(np.arange(256) >= float(prog), 255, 0))
+
+
+def filtr_rozmycia():
+    return FiltrSplotowy(np.array([[1, 2, 1], [2, 4, 2], [1, 2, 1]]) / 16.0)
+
+
+def filtr_wyostrzenia():
+    return FiltrSplotowy([[0, -1, 0], [-1, 5, -1], [0, -1, 0]])
+
+
+MAPA_FILTROW = {
+    'jasnosc': filtr_jasnosci,
+    'kontrast': filtr_kontrastu,
+    'szarosc': FiltrSkaliSzarosci,
+    'negatyw': filtr_negatywu,
+    'gamma': filtr_gamma,
+    'progowanie': filtr_progowania,
+    'rozciagniecie': RozciagniecieHistogramu,
+    'wyrownanie': WyrownanieHistogramu,
+    'rozmycie': filtr_rozmycia,
+    'wyostrzenie': filtr_wyostrzenia,
+    'sobel': FiltrSobela,
+    'mediana': FiltrMedianowy,
+}
+
+
+class PotokFiltrow:
+    MIN_WYSOKOSC_PASA = 64
+
+    def __init__(self, filtry=()):
+        self.filtry = list(filtry)
+
+    @classmethod
+    def z_opisu(cls, opis):
+        # Np. "jasnosc:20, kontrast:1.2, szarosc, rozmycie"
+        filtry = []
+        for element in opis.split(','):
+            nazwa, _, argumenty = element.strip().partition(':')
+            if not nazwa:
+                continue
+            if nazwa not in MAPA_FILTROW:
+                raise ValueError(f"Nieznany filtr: {nazwa}")
+            parametry = [float(a) for a in argumenty.split(':') if a]
+            if not all(map(math.isfinite, parametry)):
+                raise ValueError(f"Parametry filtra {nazwa} muszą być skończonymi liczbami: {argumenty}")
+            filtry.append(MAPA_FILTROW[nazwa](*parametry))
+        return cls(filtry)
+
+    @property
+    def promien(self):
+        return sum(filtr.promien for filtr in self.filtry)
+
+    def zastosuj(self, tablica, pula=None):
+        segment = []
+        for filtr in self.filtry:
+            if isinstance(filtr, FiltrHistogramowy):
+                tablica = self._przetworz_segment(tablica, segment, pula)
+                segment = []
+                filtr = filtr.przygotuj(tablica)
+            if segment and isinstance(segment[-1], FiltrPunktowy) and isinstance(filtr, FiltrPunktowy):
+                segment[-1] = segment[-1].polacz(filtr)
+            else:
+                segment.append(filtr)
+        return self._przetworz_segment(tablica, segment, pula)
+
+    def zastosuj_do_obrazu(self, obraz, pula=None):
+        return Image.fromarray(self.zastosuj(np.asarray(obraz.convert('RGB')), pula))
+
+    def _przetworz_segment(self, tablica, filtry, pula):
+        # Cały segment wykonywany jest pas po pasie w jednym przebiegu; pasy zachodzą na siebie
+        # o sumę promieni filtrów sąsiedztwa, dzięki czemu wynik jest identyczny jak dla całego obrazu.
+        if not filtry:
+            return tablica
+        wysokosc = tablica.shape[0]
+        liczba_pasow = 1
+        if pula is not None:
+            liczba_pasow = max(1, min(os.cpu_count() or 1, wysokosc // self.MIN_WYSOKOSC_PASA))
+        if liczba_pasow == 1:
+            return self._przetworz_pas(tablica, filtry)
+
+        zakladka = sum(filtr.promien for filtr in filtry)
+        granice = np.linspace(0, wysokosc, liczba_pasow + 1).astype(int)
+
+        def przetworz(zakres):
+            poczatek, koniec = zakres
+            gora, dol = max(0, poczatek - zakladka), min(wysokosc, koniec + zakladka)
+            wynik = self._przetworz_pas(tablica[gora:dol], filtry)
+            return wynik[poczatek - gora:koniec - gora]
+
+        return np.concatenate(list(pula.map(przetworz, zip(granice[:-1], granice[1:]))), axis=0)
+
+    def _przetworz_pas(self, pas, filtry):
+        for filtr in filtry:
+            pas = filtr.zastosuj(pas)
+        return pas
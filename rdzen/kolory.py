@@ -0,0 +1,35 @@
+def rgb_na_cmyk(r, g, b):
+    # Składowe RGB w zakresie 0-255, wynik CMYK w procentach (0-100).
+    r_p, g_p, b_p = r / 255.0, g / 255.0, b / 255.0
+    k = 1 - max(r_p, g_p, b_p)
+    if k == 1:
+        return 0.0, 0.0, 0.0, 100.0
+    c_100 = (1 - r_p - k) / (1 - k) * 100
+    m_100 = (1 - g_p - k) / (1 - k) * 100
+    y_100 = (1 - b_p - k) / (1 - k) * 100
+    return c_100, m_100, y_100, k * 100
+
+
+def cmyk_na_rgb(c, m, y, k):
+    c, m, y, k = c / 100.0, m / 100.0, y / 100.0, k / 100.0
+    r, g, b = 255 * (1 - c) * (1 - k), 255 * (1 - m) * (1 - k), 255 * (1 - y) * (1 - k)
+    return int(round(r)), int(round(g)), int(round(b))
+
+
+def rgb_na_hex(r, g, b):
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def hex_na_rgb(hex_color):
+    return int(hex_color[1:3], 16), int(hex_color[3:5], 16), int(hex_color[5:7], 16)
+
+
+def srednia_kolorow(hex_list):
+    r_sum, g_sum, b_sum = 0, 0, 0
+    n = len(hex_list)
+    for hex_color in hex_list:
+        r, g, b = hex_na_rgb(hex_color)
+        r_sum += r
+        g_sum += g
+        b_sum += b
+    return rgb_na_hex(r_sum // n, g_sum // n, b_sum // n)
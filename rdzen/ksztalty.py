@@ -0,0 +1,299 @@
+import base64
+import itertools
+import math
+import sys
+from array import array
+
+
+class Kształt:
+    _licznik_uid = itertools.count(1)
+
+    def __init__(self):
+        self.id_na_plotnie = None
+        self.uid = next(Kształt._licznik_uid)
+
+    def _wyczysc_stare_id(self, plotno):
+        if self.id_na_plotnie:
+            plotno.delete(self.id_na_plotnie)
+
+    def rysuj(self, plotno, kolor_konturu=None): raise NotImplementedError
+
+    def podswietl(self, plotno, kolor_konturu=None): raise NotImplementedError
+
+    def zawiera_punkt(self, x, y): raise NotImplementedError
+
+    def przesun(self, dx, dy): raise NotImplementedError
+
+    def aktualizuj_wspolrzedne(self, coords): raise NotImplementedError
+
+    def to_dict(self): raise NotImplementedError
+
+    @classmethod
+    def from_dict(cls, data): raise NotImplementedError
+
+
+class Linia(Kształt):
+    def __init__(self, x1, y1, x2, y2, kolor='black'):
+        super().__init__()
+        self.typ = 'linia'
+        self.x1, self.y1, self.x2, self.y2 = x1, y1, x2, y2
+        self.kolor = kolor
+
+    def rysuj(self, plotno, kolor_konturu=None):
+        self._wyczysc_stare_id(plotno)
+        self.id_na_plotnie = plotno.create_line(self.x1, self.y1, self.x2, self.y2, fill=kolor_konturu or self.kolor,
+                                                width=3, tags="vector")
+
+    def podswietl(self, plotno, kolor_konturu=None):
+        plotno.itemconfig(self.id_na_plotnie, fill=kolor_konturu or self.kolor)
+
+    def zawiera_punkt(self, x, y):
+        d_x, d_y = self.x2 - self.x1, self.y2 - self.y1
+        if d_x == 0 and d_y == 0: return False
+        dlugosc_kwadrat = d_x ** 2 + d_y ** 2
+        t = max(0, min(1, ((x - self.x1) * d_x + (y - self.y1) * d_y) / dlugosc_kwadrat))
+        proj_x, proj_y = self.x1 + t * d_x, self.y1 + t * d_y
+        odleglosc = math.sqrt((x - proj_x) ** 2 + (y - proj_y) ** 2)
+        return odleglosc < 5
+
+    def przesun(self, dx, dy):
+        self.x1 += dx;
+        self.y1 += dy
+        self.x2 += dx;
+        self.y2 += dy
+
+    def aktualizuj_wspolrzedne(self, coords):
+        self.x1, self.y1, self.x2, self.y2 = coords
+
+    def to_dict(self):
+        return {'typ': self.typ, 'x1': self.x1, 'y1': self.y1, 'x2': self.x2, 'y2': self.y2, 'kolor': self.kolor}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['x1'], data['y1'], data['x2'], data['y2'], data['kolor'])
+
+
+class Prostokat(Kształt):
+    def __init__(self, x1, y1, x2, y2, kolor_konturu='black', kolor_wypelnienia=''):
+        super().__init__()
+        self.typ = 'prostokat'
+        self.x1, self.y1, self.x2, self.y2 = x1, y1, x2, y2
+        self.kolor_konturu = kolor_konturu
+        self.kolor_wypelnienia = kolor_wypelnienia
+
+    def rysuj(self, plotno, kolor_konturu=None):
+        self._wyczysc_stare_id(plotno)
+        self.id_na_plotnie = plotno.create_rectangle(self.x1, self.y1, self.x2, self.y2,
+                                                     outline=kolor_konturu or self.kolor_konturu,
+                                                     fill=self.kolor_wypelnienia, width=2, tags="vector")
+
+    def podswietl(self, plotno, kolor_konturu=None):
+        plotno.itemconfig(self.id_na_plotnie, outline=kolor_konturu or self.kolor_konturu)
+
+    def zawiera_punkt(self, x, y):
+        lewo = min(self.x1, self.x2);
+        prawo = max(self.x1, self.x2)
+        gora = min(self.y1, self.y2);
+        dol = max(self.y1, self.y2)
+        return lewo <= x <= prawo and gora <= y <= dol
+
+    def przesun(self, dx, dy):
+        self.x1 += dx;
+        self.y1 += dy
+        self.x2 += dx;
+        self.y2 += dy
+
+    def aktualizuj_wspolrzedne(self, coords):
+        self.x1, self.y1, self.x2, self.y2 = coords
+
+    def to_dict(self):
+        return {'typ': self.typ, 'x1': self.x1, 'y1': self.y1, 'x2': self.x2, 'y2': self.y2,
+                'kolor_konturu': self.kolor_konturu, 'kolor_wypelnienia': self.kolor_wypelnienia}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['x1'], data['y1'], data['x2'], data['y2'], data['kolor_konturu'], data['kolor_wypelnienia'])
+
+
+class Okrag(Prostokat):
+    def __init__(self, x1, y1, x2, y2, kolor_konturu='blue', kolor_wypelnienia=''):
+        super().__init__(x1, y1, x2, y2, kolor_konturu, kolor_wypelnienia)
+        self.typ = 'okrag'
+
+    def rysuj(self, plotno, kolor_konturu=None):
+        self._wyczysc_stare_id(plotno)
+        self.id_na_plotnie = plotno.create_oval(self.x1, self.y1, self.x2, self.y2,
+                                                outline=kolor_konturu or self.kolor_konturu,
+                                                fill=self.kolor_wypelnienia, width=2, tags="vector")
+
+
+def _odleglosc_od_odcinka(x, y, x1, y1, x2, y2):
+    d_x, d_y = x2 - x1, y2 - y1
+    dlugosc_kwadrat = d_x ** 2 + d_y ** 2
+    if dlugosc_kwadrat == 0:
+        return math.hypot(x - x1, y - y1)
+    t = max(0, min(1, ((x - x1) * d_x + (y - y1) * d_y) / dlugosc_kwadrat))
+    return math.hypot(x - (x1 + t * d_x), y - (y1 + t * d_y))
+
+
+def _roznica_katow(a, b):
+    return (a - b + math.pi) % (2 * math.pi) - math.pi
+
+
+class Lamana(Kształt):
+    MIN_ODLEGLOSC = 1.0
+    TOLERANCJA = 1.0
+    TOLERANCJA_TRAFIENIA = 5
+
+    def __init__(self, punkty=(), kolor='black'):
+        super().__init__()
+        self.typ = 'lamana'
+        # Płaska tablica float32 [x0, y0, x1, y1, ...] zamiast listy obiektów.
+        self.punkty = array('f', punkty)
+        self.kolor = kolor
+        self._pominiety_punkt = None
+        self._ramka = None
+        # Stan filtra stożkowego dla odcinka od kotwicy (przedostatniego punktu) do ostatniego punktu.
+        self._stozek = None
+        self._maks_odleglosc = math.inf
+
+    def _wspolrzedne_do_rysowania(self):
+        if len(self.punkty) >= 4:
+            return self.punkty
+        return list(self.punkty) * 2
+
+    def _ramka_ograniczajaca(self):
+        if self._ramka is None:
+            self._ramka = (min(self.punkty[0::2]), min(self.punkty[1::2]),
+                           max(self.punkty[0::2]), max(self.punkty[1::2]))
+        return self._ramka
+
+    @property
+    def x1(self): return self._ramka_ograniczajaca()[0]
+
+    @property
+    def y1(self): return self._ramka_ograniczajaca()[1]
+
+    @property
+    def x2(self): return self._ramka_ograniczajaca()[2]
+
+    @property
+    def y2(self): return self._ramka_ograniczajaca()[3]
+
+    def _od_kotwicy(self, x, y):
+        kotwica_x, kotwica_y = self.punkty[-4], self.punkty[-3]
+        return math.hypot(x - kotwica_x, y - kotwica_y), math.atan2(y - kotwica_y, x - kotwica_x)
+
+    def _zawez_stozek(self, x, y):
+        # Zawęża przedział kierunków od kotwicy, dla których punkt leży w tolerancji od cięciwy.
+        odleglosc, kat = self._od_kotwicy(x, y)
+        self._maks_odleglosc = max(self._maks_odleglosc, odleglosc)
+        if odleglosc <= self.TOLERANCJA: return
+        polowa = math.asin(self.TOLERANCJA / odleglosc)
+        if self._stozek is None:
+            self._stozek = (kat, -polowa, polowa)
+            return
+        odniesienie, dolna, gorna = self._stozek
+        wzgledny = _roznica_katow(kat, odniesienie)
+        self._stozek = (odniesienie, max(dolna, wzgledny - polowa), min(gorna, wzgledny + polowa))
+
+    def _w_stozku(self, x, y):
+        # Nowy koniec nie może leżeć bliżej kotwicy niż pominięte punkty - inaczej wypadłyby poza odcinek.
+        odleglosc, kat = self._od_kotwicy(x, y)
+        if odleglosc < self._maks_odleglosc: return False
+        if self._stozek is None: return True
+        odniesienie, dolna, gorna = self._stozek
+        return dolna <= _roznica_katow(kat, odniesienie) <= gorna
+
+    def dodaj_punkt(self, x, y):
+        # Filtr stożkowy działający na bieżąco podczas rysowania: ostatni punkt jest zastępowany nowym tylko wtedy,
+        # gdy wszystkie punkty pominięte od kotwicy leżą w tolerancji od nowej cięciwy.
+        self._ramka = None
+        if not self.punkty:
+            self.punkty.extend((x, y))
+            return
+        ostatni_x, ostatni_y = self.punkty[-2], self.punkty[-1]
+        if math.hypot(x - ostatni_x, y - ostatni_y) < self.MIN_ODLEGLOSC:
+            self._pominiety_punkt = (x, y)
+            if len(self.punkty) >= 4: self._zawez_stozek(x, y)
+            return
+        self._pominiety_punkt = None
+        if len(self.punkty) >= 4 and self._w_stozku(x, y):
+            self.punkty[-2], self.punkty[-1] = x, y
+        else:
+            self.punkty.extend((x, y))
+            self._stozek, self._maks_odleglosc = None, 0.0
+        self._zawez_stozek(x, y)
+
+    def zakoncz(self):
+        if self._pominiety_punkt:
+            self.punkty.extend(self._pominiety_punkt)
+            self._pominiety_punkt = None
+        self._ramka = None
+
+    def rysuj(self, plotno, kolor_konturu=None):
+        self._wyczysc_stare_id(plotno)
+        self.id_na_plotnie = plotno.create_line(*self._wspolrzedne_do_rysowania(), fill=kolor_konturu or self.kolor,
+                                                width=3, capstyle='round', joinstyle='round', tags="vector")
+
+    def podswietl(self, plotno, kolor_konturu=None):
+        plotno.itemconfig(self.id_na_plotnie, fill=kolor_konturu or self.kolor)
+
+    def aktualizuj_na_plotnie(self, plotno):
+        if self.id_na_plotnie:
+            plotno.coords(self.id_na_plotnie, *self._wspolrzedne_do_rysowania())
+        else:
+            self.rysuj(plotno)
+
+    def zawiera_punkt(self, x, y):
+        # Kliknięcie poza ramką całej łamanej odrzucane jest od razu; ramki odcinków liczone są w locie,
+        # a dokładna odległość tylko dla odcinków, w których ramce leży punkt.
+        p, t = self.punkty, self.TOLERANCJA_TRAFIENIA
+        if len(p) < 4: return False
+        lewo, gora, prawo, dol = self._ramka_ograniczajaca()
+        if not (lewo - t <= x <= prawo + t and gora - t <= y <= dol + t): return False
+        for i in range(0, len(p) - 2, 2):
+            ax, ay, bx, by = p[i], p[i + 1], p[i + 2], p[i + 3]
+            if min(ax, bx) - t <= x <= max(ax, bx) + t and min(ay, by) - t <= y <= max(ay, by) + t and \
+                    _odleglosc_od_odcinka(x, y, ax, ay, bx, by) < t:
+                return True
+        return False
+
+    def przesun(self, dx, dy):
+        p = self.punkty
+        for i in range(0, len(p), 2):
+            p[i] += dx
+            p[i + 1] += dy
+        self._ramka = None
+
+    def aktualizuj_wspolrzedne(self, coords):
+        # Współrzędne x1..y2 łamanej to jej prostokąt ograniczający - zmiana go skaluje całą łamaną.
+        stare_x1, stare_y1, stare_x2, stare_y2 = self.x1, self.y1, self.x2, self.y2
+        skala_x = (coords[2] - coords[0]) / (stare_x2 - stare_x1) if stare_x2 != stare_x1 else 1.0
+        skala_y = (coords[3] - coords[1]) / (stare_y2 - stare_y1) if stare_y2 != stare_y1 else 1.0
+        p = self.punkty
+        for i in range(0, len(p), 2):
+            p[i] = (p[i] - stare_x1) * skala_x + coords[0]
+            p[i + 1] = (p[i + 1] - stare_y1) * skala_y + coords[1]
+        self._ramka = None
+
+    def to_dict(self):
+        dane = array('f', self.punkty)
+        if sys.byteorder != 'little':
+            dane.byteswap()
+        return {'typ': self.typ, 'punkty': base64.b64encode(dane.tobytes()).decode('ascii'), 'kolor': self.kolor}
+
+    @classmethod
+    def from_dict(cls, data):
+        punkty = array('f', base64.b64decode(data['punkty']))
+        if sys.byteorder != 'little':
+            punkty.byteswap()
+        return cls(punkty, data['kolor'])
+
+
+MAPA_KLAS = {'linia': Linia, 'prostokat': Prostokat, 'okrag': Okrag, 'lamana': Lamana}
+
+
+def ksztalt_z_dict(dane):
+    klasa_ksztaltu = MAPA_KLAS.get(dane.get('typ'))
+    return klasa_ksztaltu.from_dict(dane) if klasa_ksztaltu else None
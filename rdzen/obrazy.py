@@ -0,0 +1,18 @@
+from PIL import Image
+
+
+def wczytaj_obraz(sciezka_pliku):
+    img = Image.open(sciezka_pliku)
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    return img
+
+
+def zapisz_jako_jpeg(obraz, sciezka_pliku, jakosc):
+    obraz.convert('RGB').save(sciezka_pliku, 'JPEG', quality=jakosc)
+
+
+def przeskaluj(obraz, szerokosc, wysokosc):
+    if (szerokosc, wysokosc) == obraz.size:
+        return obraz
+    return obraz.resize((szerokosc, wysokosc), Image.NEAREST)